@@ -0,0 +1,54 @@
+""" Benchmark of the projection XB constructR(thetas) Wa computed by each
+    backend, against the unfused product of the original implementation.
+
+    Usage:
+        python benchmarks/rotateProject.py [maxN] [d]
+"""
+import sys
+import time
+
+import numpy as np
+
+from pytour import constructR, rotateProject, setBackend
+from pytour.utils import kernels
+
+
+def timeCall(f, repeats):
+    """ Return the smallest number of seconds taken by f() over repeats calls.
+    """
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(maxN=10**7, d=2, repeats=5):
+    thetas = np.random.uniform(size=d)
+    Wa, _ = np.linalg.qr(np.random.normal(size=(2*d, d)))
+    backends = ["numpy"] + (["numba"] if kernels.loadNumba() else [])
+
+    print("%10s %10s" % ("n", "unfused") + "".join("%10s" % b
+        for b in backends))
+
+    n = 10**4
+    while n <= maxN:
+        XB = np.random.normal(size=(n, 2*d))
+        out = np.empty((n, d))
+
+        times = [timeCall(lambda: XB @ constructR(thetas) @ Wa, repeats)]
+        for backend in backends:
+            setBackend(backend)
+            rotateProject(XB, thetas, Wa, out=out)
+            times += [timeCall(lambda: rotateProject(XB, thetas, Wa,
+                out=out), repeats)]
+
+        print("%10d" % n + "".join("%9.5fs" % t for t in times))
+        n *= 10
+
+    setBackend("numpy")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
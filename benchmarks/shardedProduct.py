@@ -0,0 +1,57 @@
+""" Benchmark of the sharded X @ B product as the number of worker processes
+    grows, compared with a single in-process product.
+
+    Usage:
+        python benchmarks/shardedProduct.py [n] [p] [maxWorkers]
+"""
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+
+from pytour import ShardedData
+
+
+def timeProduct(X, B, repeats):
+    """ Time the product X @ B.
+
+        Inputs:
+            X - A 2D numpy array or ShardedData object of shape (n,p)
+            B - A 2D numpy array of shape (p,k)
+            repeats - A positive int representing the number of products timed
+
+        Outputs:
+            The smallest number of seconds taken by a single product.
+    """
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        X @ B
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n=10**7, p=20, maxWorkers=None, d=2, repeats=3):
+    if maxWorkers is None:
+        maxWorkers = multiprocessing.cpu_count()
+
+    X = np.random.normal(size=(n, p))
+    B, _ = np.linalg.qr(np.random.normal(size=(p, 2*d)))
+
+    print("n=%d p=%d data=%.1f MB" % (n, p, X.nbytes / 1e6))
+    baseline = timeProduct(X, B, repeats)
+    print("numpy          %.4fs" % baseline)
+
+    numWorkers = 1
+    while numWorkers <= maxWorkers:
+        with ShardedData(X, numWorkers=numWorkers) as S:
+            S @ B
+            elapsed = timeProduct(S, B, repeats)
+        print("%3d workers    %.4fs  (%.2fx numpy)" % (numWorkers, elapsed,
+            baseline / elapsed))
+        numWorkers *= 2
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:4]])
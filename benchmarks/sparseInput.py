@@ -0,0 +1,68 @@
+""" Benchmark comparing tours over sparse data with tours over the same data
+    after densification.
+
+    Usage:
+        python benchmarks/sparseInput.py [n] [p] [density]
+"""
+import sys
+import time
+
+import numpy as np
+import scipy.sparse
+
+from pytour import GrandTour
+
+
+def timeTour(X, d, numLegs, center):
+    """ Time the construction of a tour and of numLegs paths to new frames.
+
+        Inputs:
+            X - A 2D numpy array or scipy.sparse matrix of shape (n,p)
+            d - A positive int representing the dimension of the projections
+            numLegs - A positive int representing the number of legs to time
+            center - A boolean passed on to the tour
+
+        Outputs:
+            The average number of seconds taken per leg.
+    """
+    start = time.perf_counter()
+    tour = GrandTour(X, d, numSteps=10, center=center)
+    for _ in range(numLegs - 1):
+        tour.createPathToNewFrame()
+    return (time.perf_counter() - start) / numLegs
+
+
+def main(n=20000, p=2000, density=1e-3, d=2, numLegs=5, maxDenseBytes=2**30):
+    X = scipy.sparse.random(n, p, density=density, format="csr",
+        random_state=np.random.default_rng(0))
+    denseBytes = n * p * 8
+
+    print("n=%d p=%d density=%g nnz=%d" % (n, p, density, X.nnz))
+    print("sparse data: %8.1f MB" % ((X.data.nbytes + X.indices.nbytes
+        + X.indptr.nbytes) / 1e6))
+    print("dense data:  %8.1f MB" % (denseBytes / 1e6))
+
+    for center in (False, True):
+        sparseTime = timeTour(X, d, numLegs, center)
+
+        # Densifying large inputs would exhaust memory, which is the point of
+        # supporting sparse data in the first place.
+        if denseBytes > maxDenseBytes:
+            print("center=%-5s sparse %.4fs/leg   dense skipped (over %.1f MB)"
+                % (center, sparseTime, maxDenseBytes / 1e6))
+            continue
+
+        start = time.perf_counter()
+        Xdense = X.toarray()
+        densifyTime = time.perf_counter() - start
+        denseTime = timeTour(Xdense, d, numLegs, center)
+        del Xdense
+
+        print("center=%-5s sparse %.4fs/leg   dense %.4fs/leg "
+            "(+%.2fs to densify)" % (center, sparseTime, denseTime,
+            densifyTime))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(*[int(a) for a in args[:2]], *[float(a) for a in args[2:3]])
@@ -1,12 +1,18 @@
+import time
+
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import animation
+from matplotlib.colors import to_rgba
+from ..utils import screenSteps, stratifiedOrder
 
 class AnimatedPlot:
     """ A plot utility that takes in a specified tour, and creates an
         interactive matplotlib.pyplot figure that explores the data.
     """
 
-    def __init__(self, tour, plot_kwargs={}, anim_kwargs={}, saveFile=None):
+    def __init__(self, tour, plot_kwargs={}, anim_kwargs={}, saveFile=None,
+        pixelBudget=None, stepsPerSecond=None, lodPoints=None, lodChunk=None):
         """ Constructs the Animated Plot object.
 
             Inputs:
@@ -15,17 +21,106 @@ class AnimatedPlot:
                     plotting utility.
                 anim_kwargs - A dict specifying the arguments passed onto theh
                     animaiton utility.
+                saveFile - A string specifying a file to save the animation
+                    to, or None if the animation should not be saved.
+                pixelBudget - A positive float representing the largest number
+                    of pixels any point may move in a single frame, or None.
+                    Requires a tour created with a nonzero screenStep, which
+                    is replaced by the equivalent distance in the initial
+                    axes, and the current path rescheduled. None by default.
+                stepsPerSecond - A positive float representing how many tour
+                    steps should pass per second of wall-clock time, or None.
+                    If given, the tour advances according to elapsed real
+                    time, skipping the steps that could not be rendered in
+                    time. If None, the tour advances one step per frame. None
+                    by default.
+                lodPoints - A positive int representing the number of points
+                    drawn while the tour moves, or None to always draw every
+                    point. The points are a stratified subsample, see
+                    stratifiedOrder, and only they are projected. Whenever the
+                    tour or the animation is paused, the remaining points are
+                    added progressively. None by default.
+                lodChunk - A positive int representing the number of points
+                    added per frame while refining, or None to use lodPoints.
+                    None by default.
         """
 
         self.tour = tour
+        self.stepsPerSecond = stepsPerSecond
+
+        # Timing statistics, see the statistics method.
+        self.lastTick = None
+        self.updateTick = None
+        self.stepDebt = 0.0
+        self.frames = 0
+        self.steps = 0
+        self.droppedSteps = 0
+        self.computeTime = 0.0
+        self.renderTime = 0.0
         
         # Setup the initial plot:
         proj = self.tour.currentProjection()
+        self.numPoints = proj.shape[0]
+
         self.fig = plt.figure( figsize=(8,6) )
         self.ax = self.fig.add_subplot(111)
         self.sc = self.ax.scatter(proj[:,0], proj[:,1], **plot_kwargs)
+        self.baseColors = None
+
+        # No region is highlighted initially, see the highlight method.
+        self.region = None
+        self.regionMask = None
+        self.regionPath = None
+
+        # Setup the level of detail. The points are drawn in an order that is
+        # stratified for the current path, so drawing a prefix of them draws
+        # a representative subsample. The appearance of every point is
+        # captured first, so the points can be redrawn in any order.
+        self.lod = lodPoints is not None and lodPoints < self.numPoints
+        self.lodPoints = lodPoints
+        self.lodChunk = lodChunk if lodChunk is not None else lodPoints
+        self.lodProj = proj.copy()
+        self.lodPath = None
+        self.numShown = self.numPoints
+        self.order = None
+        self.orderPath = None
+
+        if self.lod:
+            self.sc.update_scalarmappable()
+            self.baseColors = np.broadcast_to(self.sc.get_facecolors(),
+                (self.numPoints, 4)).copy()
+            self.baseSizes = np.broadcast_to(self.sc.get_sizes(),
+                (self.numPoints,)).copy()
+
+            # The colors are reordered explicitly from now on, so drawing must
+            # not map the data values, given in the original order, again.
+            self.sc.set_array(None)
+
+            # Edges only need reordering if they do not follow the faces.
+            edgeColors = self.sc.get_edgecolors()
+            if edgeColors is self.sc.get_facecolors() or len(edgeColors) <= 1:
+                self.baseEdgeColors = None
+            else:
+                self.baseEdgeColors = np.broadcast_to(edgeColors,
+                    (self.numPoints, 4)).copy()
+
+            self.updateOrder()
+            self.sc.set_offsets(proj[self.order])
+
+        # Convert the pixel budget into a distance in the projection, and
+        # reschedule the current path with it.
+        if pixelBudget is not None:
+            if getattr(self.tour, "mode", None) != "constScreen":
+                raise ValueError('AnimatedPlot pixelBudget requires a tour '\
+                    'created with a nonzero screenStep.')
+            self.tour.screenStep = pixelBudget * self.dataPerPixel()
+            self.tour.moveSteps = screenSteps(self.tour.XB, self.tour.thetas,
+                self.tour.screenStep)
 
         
+        # Measure the time spent rendering each updated frame:
+        self.fig.canvas.mpl_connect('draw_event', self.drawn)
+
         # Create animation:
         self.animation = animation.FuncAnimation(
             self.fig, self.update, **anim_kwargs
@@ -41,9 +136,11 @@ class AnimatedPlot:
         self.fig.canvas.mpl_connect('motion_notify_event', self.hover)
 
         
-        # Create pause utility:
+        # Create pause utility, refining the level of detail while paused:
         self.paused = False
         self.fig.canvas.mpl_connect('button_press_event', self.pause)
+        self.refineTimer = self.fig.canvas.new_timer(interval=50)
+        self.refineTimer.add_callback(self.refine)
 
         if saveFile != None:
             self.animation.save(saveFile)
@@ -55,7 +152,8 @@ class AnimatedPlot:
 
 
     def update(self, i):
-        """ Update the plot and tour by one timestep.
+        """ Update the plot and tour by one timestep, or by as many timesteps
+            as have elapsed in real time if stepsPerSecond was given.
 
             Inputs:
                 i - A positive integer representing the current time (unused)
@@ -63,10 +161,227 @@ class AnimatedPlot:
             Output:
                 A handle to the updated scatterplot.
         """
-        proj = self.tour.advance()
-        self.sc.set_offsets(proj)
+        now = time.perf_counter()
+
+        # Determine how many steps are owed. In real time mode, the steps
+        # owed since the last frame are accumulated and only whole steps are
+        # taken, so the tour keeps its pace however slow rendering is.
+        if self.stepsPerSecond is None or self.lastTick is None:
+            owedSteps = 1
+        else:
+            self.stepDebt += (now - self.lastTick) * self.stepsPerSecond
+            owedSteps = int(self.stepDebt)
+        self.lastTick = now
+
+        if owedSteps == 0:
+            return self.sc
+
+        # Take the owed steps, but start at most one new path per frame, as
+        # every new path requires projecting the whole data. The steps left
+        # over stay owed and are taken in the following frames.
+        path = self.tour.B
+        numSteps = 0
+        while numSteps < owedSteps and self.tour.B is path:
+            self.tour.step()
+            numSteps += 1
+        if self.stepsPerSecond is not None:
+            self.stepDebt -= numSteps
+
+        # Only the projection of the last step is computed and rendered.
+        self.sc.set_offsets(self.project())
+        self.updateHighlight()
+
+        self.frames += 1
+        self.steps += numSteps
+        self.droppedSteps += numSteps - 1
+        self.updateTick = time.perf_counter()
+        self.computeTime += self.updateTick - now
         return self.sc
 
+    def project(self):
+        """ Project the points to draw at the current step of the tour.
+
+            Inputs:
+                None
+
+            Output:
+                A 2D numpy array holding the projection of the points drawn,
+                in drawing order. While the tour moves, this is the projection
+                of the first lodPoints points only. While it is still, every
+                call adds the projection of the next lodChunk points, until
+                all points are drawn.
+        """
+        if not self.lod:
+            return self.tour.currentProjection()
+        self.updateOrder()
+
+        # While moving, only the subsample is projected.
+        still = self.paused or not self.tour.moveFlag
+        if not still:
+            self.lodPath = None
+            self.numShown = self.lodPoints
+            return self.tour.currentProjection(self.order[:self.numShown])
+
+        # While still, the projection does not change, so previously projected
+        # points are kept and only the next chunk is projected.
+        if self.lodPath is not self.tour.B:
+            self.lodPath = self.tour.B
+            start, stop = 0, self.lodPoints
+        else:
+            start = self.numShown
+            stop = min(self.numPoints, start + self.lodChunk)
+
+        if stop > start:
+            self.lodProj[start:stop] = self.tour.currentProjection(
+                self.order[start:stop])
+        self.numShown = stop
+        return self.lodProj[:stop]
+
+    def updateOrder(self):
+        """ Recompute the drawing order of the points whenever the tour has
+            moved on to a new path. The order is stratified on XB, which
+            holds every projection of the path, so points that become
+            outliers anywhere along the path are drawn early.
+        """
+        if self.orderPath is self.tour.B:
+            return
+        self.orderPath = self.tour.B
+        self.order = stratifiedOrder(self.tour.XB)
+        self.lodPath = None
+
+        self.sc.set_facecolors(self.baseColors[self.order])
+        self.sc.set_sizes(self.baseSizes[self.order])
+        if self.baseEdgeColors is not None:
+            self.sc.set_edgecolors(self.baseEdgeColors[self.order])
+
+    def refine(self):
+        """ Draw the next chunk of points while the animation is paused.
+
+            Inputs:
+                None
+
+            Output:
+                No output given, but more points are drawn until all are.
+        """
+        if not self.paused or self.numShown == self.numPoints:
+            return
+        self.sc.set_offsets(self.project())
+        self.updateHighlight()
+        self.fig.canvas.draw_idle()
+
+    def drawn(self, event):
+        """ Record the time taken to render the last updated frame.
+
+            Inputs:
+                event - a matplotlib.pyplot draw event
+
+            Output:
+                No output given, but the render time is accumulated.
+        """
+        if self.updateTick is not None:
+            self.renderTime += time.perf_counter() - self.updateTick
+            self.updateTick = None
+
+    def statistics(self):
+        """ Return the measured timing statistics of the animation.
+
+            Inputs:
+                None
+
+            Outputs:
+                A dict with the number of frames rendered, the number of tour
+                steps taken and dropped (taken without being rendered), and the
+                mean compute and render time per frame in seconds.
+        """
+        frames = max(self.frames, 1)
+        return {
+            'frames': self.frames,
+            'steps': self.steps,
+            'droppedSteps': self.droppedSteps,
+            'computeTime': self.computeTime / frames,
+            'renderTime': self.renderTime / frames,
+        }
+
+    def highlight(self, polygon=None, box=None, color="red"):
+        """ Highlight the points that lie inside a region of the projection
+            as the tour moves. Membership is computed for all the steps of a
+            path at once when the tour starts the path, and kept packed into
+            bits, see SimpleTour.regionMask.
+
+            Inputs:
+                polygon - A 2D numpy array of size (m,2) representing the
+                    vertices of a polygon in the projection, or None.
+                box - A tuple (xmin, xmax, ymin, ymax) representing a box in
+                    the projection, or None. Exactly one of polygon and box
+                    should be given.
+                color - A matplotlib color used for the highlighted points.
+                    Red by default.
+
+            Output:
+                No output given, but the highlighted points are recolored.
+        """
+        if (polygon is None) == (box is None):
+            raise ValueError('highlight should be given exactly one of '\
+                'polygon or box.')
+
+        if self.baseColors is None:
+            # Colormapped scatters only compute their colors when drawn.
+            self.sc.update_scalarmappable()
+            self.baseColors = np.broadcast_to(self.sc.get_facecolors(),
+                (self.numPoints, 4)).copy()
+        self.region = dict(polygon=polygon, box=box)
+        self.regionColor = to_rgba(color)
+        self.regionPath = None
+        self.updateHighlight()
+
+    def clearHighlight(self):
+        """ Remove the highlighting set by the highlight method.
+        """
+        # With a level of detail, restore the colors of all the points in
+        # drawing order, so points drawn later keep their own colors.
+        if self.region is not None:
+            if self.lod:
+                self.sc.set_facecolors(self.baseColors[self.order])
+            else:
+                self.sc.set_facecolors(self.baseColors)
+        self.region = None
+        self.regionMask = None
+        self.regionPath = None
+
+    def updateHighlight(self):
+        """ Recolor the points inside the highlighted region at the current
+            step of the tour, recomputing the membership of every step when
+            the tour has moved on to a new path.
+        """
+        if self.region is None:
+            return
+
+        path = (self.tour.B, self.tour.moveSteps)
+        if self.regionPath is None or self.regionPath[0] is not path[0] or \
+            self.regionPath[1] != path[1]:
+            self.regionMask = self.tour.regionMask(packed=True, **self.region)
+            self.regionPath = path
+
+        # Colors follow the drawing order of the points.
+        # The mask is packed into bits along the steps, so read bit t.
+        drawn = self.drawnPoints()
+        t = self.tour.currentStep()
+        inside = (self.regionMask[drawn, t >> 3] >> (7 - (t & 7))) & 1
+        inside = inside.astype(bool)
+
+        colors = self.baseColors[drawn].copy()
+        colors[inside] = self.regionColor
+        self.sc.set_facecolors(colors)
+
+    def drawnPoints(self):
+        """ Return the indices of the points currently drawn, in drawing
+            order, or a slice selecting all points if every point is drawn in
+            its original order.
+        """
+        if not self.lod:
+            return slice(None)
+        return self.order[:self.numShown]
+
     def hover(self, event):
         """ Update the annotation given the specified event
 
@@ -83,7 +398,10 @@ class AnimatedPlot:
             if cont:
                 pos = self.sc.get_offsets()[ind["ind"][0]]
                 self.annot.xy = pos
-                text = str( ind["ind"][0] )
+                index = ind["ind"][0]
+                if self.lod:
+                    index = self.order[index]
+                text = str( index )
                 self.annot.set_text(text)
                 self.annot.set_visible(True)
                 self.fig.canvas.draw()
@@ -104,11 +422,33 @@ class AnimatedPlot:
                 and plays if was paused.
         """
         if self.paused:
+            # Time spent paused is not owed to the tour.
+            self.lastTick = None
+            self.stepDebt = 0.0
+            self.refineTimer.stop()
             self.animation.event_source.start()
         else:
             self.animation.event_source.stop()
+            if self.lod:
+                self.refineTimer.start()
         self.paused = not self.paused
 
+    def dataPerPixel(self):
+        """ Return the distance in the projection spanned by a single pixel.
+
+            Inputs:
+                None
+
+            Outputs:
+                A positive float representing the smaller of the horizontal
+                and vertical distances in data coordinates covered by one
+                pixel of the axes.
+        """
+        bbox = self.ax.get_window_extent()
+        xmin, xmax = self.ax.get_xlim()
+        ymin, ymax = self.ax.get_ylim()
+        return min( abs(xmax-xmin) / bbox.width, abs(ymax-ymin) / bbox.height )
+
     def currentFrame(self):
         """ Return the current frame of the tour.
 
@@ -8,12 +8,12 @@ class CustomTour(SimpleTour):
 		are specifed by a generator function.
 	"""
 
-	def __init__(self, X, generator, pause=0):
+	def __init__(self, X, generator, pause=0, center=False, scale=False):
 		""" Constructs a CheckpointTour object.
 
 			Inputs:
-				X - A 2D numpy array of shape (n,p) representing the data to be 
-					visualized
+				X - A 2D numpy array or scipy.sparse matrix of shape (n,p)
+					representing the data to be visualized
 
 				generator - A python function that takes in 2D numpy arrays of
 					size (p,d) representing the souce frame as input, and
@@ -25,13 +25,20 @@ class CustomTour(SimpleTour):
 
 				pause - A non-negative int representing how many timesteps to
 					pause for whenever a new frame is reached. Zero by default.
+				center - A boolean. If True, the data is centered implicitly
+					when projected, without making a centered copy of X.
+					False by default.
+				scale - A boolean. If True, the data is scaled to unit variance
+					implicitly when projected, without making a scaled copy of
+					X. The variances are computed in a single pass over chunks
+					of rows. False by default.
 
 			Outputs:
 				A CheckpointTour object
 		"""
 
 		self.X = X
-		super().__init__(pause=pause)
+		super().__init__(pause=pause, center=center, scale=scale)
 
 	def nextFrame(self, lastFrame):
 		""" A method that gives the next frame and the number of steps that
@@ -7,49 +7,66 @@ class GrandTour(SimpleTour):
 		frame to travel to.
 	"""
 
-	def __init__(self, X, d, numSteps=0, rotSpeed=0, pause=0):
+	def __init__(self, X, d, numSteps=0, rotSpeed=0, pause=0,
+		center=False, screenStep=0, scale=False):
 		""" Constructs a GrandTour object.
 
 			Inputs:
-				X - A 2D numpy array of shape (n,p) representing the data to be 
-					visualized
+				X - A 2D numpy array or scipy.sparse matrix of shape (n,p)
+					representing the data to be visualized
 				d - A positive int representing the dimension of the projections
 					representing the frames that the tour will travel to
 				numSteps - A positive int representing the number of steps that
-					should be taken between two frames. If rotSpeed is zero, 
-					this parameter should be ignored.
+					should be taken between two frames. Zero by default.
 				rotSpeed - A positive float representing how fast the rotations
-					should be from frame to frame. If numSteps is zero, this
-					parameter should be ignored.
+					should be from frame to frame. Zero by default.
+				screenStep - A positive float representing the largest distance
+					any projected point may move in a single step. The number
+					of steps taken between two frames is chosen per path so
+					that this bound holds. Zero by default. Exactly one of
+					numSteps, rotSpeed and screenStep should be nonzero.
 				pause - A non-negative int representing how many timesteps to
 					pause for whenever a new frame is reached. Zero by default.
+				center - A boolean. If True, the data is centered implicitly
+					when projected, without making a centered copy of X.
+					False by default.
+				scale - A boolean. If True, the data is scaled to unit variance
+					implicitly when projected, without making a scaled copy of
+					X. The variances are computed in a single pass over chunks
+					of rows. False by default.
 
 			Outputs:
 				A GrandTour object
 		"""
 
 
-		# Check if exactly one of stepsBetweenFrames or rotSpeed
-		# is nonzero.
-		constTime  = (numSteps!= 0)
-		constSpeed = (rotSpeed!= 0)
+		# Check if exactly one of numSteps, rotSpeed or screenStep is
+		# nonzero.
+		constTime   = (numSteps!= 0)
+		constSpeed  = (rotSpeed!= 0)
+		constScreen = (screenStep!= 0)
 
-		if constTime and constSpeed:
-			raise ValueError('PresetTour input should have exactly one of '/
-				'numSteps or rotSpeed be nonzero.')
-		elif not constTime and not constSpeed:
-			raise ValueError('PresetTour input should have exactly one of '/
-				'numSteps or rotSpeed be nonzero.')
+		if constTime + constSpeed + constScreen != 1:
+			raise ValueError('GrandTour input should have exactly one of '\
+				'numSteps, rotSpeed or screenStep be nonzero.')
 
 		elif constTime:
 			self.mode = "constTime"
 			self.moveSteps = numSteps
 			self.rotSpeed = None 
+			self.screenStep = None
 
-		else:
+		elif constSpeed:
 			self.mode = "constSpeed"
 			self.moveSteps = None
 			self.rotSpeed = rotSpeed
+			self.screenStep = None
+
+		else:
+			self.mode = "constScreen"
+			self.moveSteps = None
+			self.rotSpeed = None
+			self.screenStep = screenStep
 
 
 		self.X = X
@@ -57,7 +74,7 @@ class GrandTour(SimpleTour):
 		self.d = d
 		# self.stepsBetweenFrames = stepsBetweenFrames
 
-		super().__init__(pause=pause)
+		super().__init__(pause=pause, center=center, scale=scale)
 
 
 	def nextFrame(self, lastFrame):
@@ -91,11 +108,16 @@ class GrandTour(SimpleTour):
 		# no changes, and then scale up the number of steps so that we're
 		# constant.
 		elif self.mode == "constSpeed":
-			if lastFrame == None:
+			if lastFrame is None:
 				numSteps = 0
 			else:
 				B, thetas, Wa = interpolateFrames(lastFrame, newFrame)
 				numSteps = int(pathSpeed(B, thetas, Wa) / self.rotSpeed)
 
+		# If we are moving with constant screen speed, the number of steps
+		# depends on the projected data, and is set once the path is created.
+		elif self.mode == "constScreen":
+			numSteps = None
+
 
 		return (newFrame, numSteps)
\ No newline at end of file
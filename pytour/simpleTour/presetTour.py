@@ -8,51 +8,73 @@ class PresetTour(SimpleTour):
 		and repeats once again.
 	"""
 
-	def __init__(self, X, framesList, numSteps=0, rotSpeed=0, pause=0):
+	# Preset and checkpoint tours revisit the same paths, so their
+	# projections are worth saving to disk.
+	persistPaths = True
+
+	def __init__(self, X, framesList, numSteps=0, rotSpeed=0, pause=0,
+		center=False, screenStep=0, scale=False):
 		""" Constructs a PresetTour object.
 
 			Inputs:
-				X - A 2D numpy array of shape (n,p) representing the data to be 
-					visualized
+				X - A 2D numpy array or scipy.sparse matrix of shape (n,p)
+					representing the data to be visualized
 				framesList - A list of 2D numpy arrays of shape (p,d) 
 					representing the frames that the tour will travel to
 				numSteps - A positive int representing the number of steps that
-					should be taken between two frames. If rotSpeed is zero, 
-					this parameter should be ignored.
+					should be taken between two frames. Zero by default.
 				rotSpeed - A positive float representing how fast the rotations
-					should be from frame to frame. If numSteps is zero, this
-					parameter should be ignored.
+					should be from frame to frame. Zero by default.
+				screenStep - A positive float representing the largest distance
+					any projected point may move in a single step. The number
+					of steps taken between two frames is chosen per path so
+					that this bound holds. Zero by default. Exactly one of
+					numSteps, rotSpeed and screenStep should be nonzero.
 				pause - A non-negative int representing how many timesteps to
 					pause for whenever a new frame is reached. Zero by default.
+				center - A boolean. If True, the data is centered implicitly
+					when projected, without making a centered copy of X.
+					False by default.
+				scale - A boolean. If True, the data is scaled to unit variance
+					implicitly when projected, without making a scaled copy of
+					X. The variances are computed in a single pass over chunks
+					of rows. False by default.
 
 			Outputs:
 				A PresetTour object
 		"""
 
 
-		# Check if exactly one of stepsBetweenFrames or rotSpeed
-		# is nonzero.
-		constTime  = (numSteps!= 0)
-		constSpeed = (rotSpeed!= 0)
+		# Check if exactly one of numSteps, rotSpeed or screenStep is
+		# nonzero.
+		constTime   = (numSteps!= 0)
+		constSpeed  = (rotSpeed!= 0)
+		constScreen = (screenStep!= 0)
 
-		if constTime and constSpeed:
-			raise ValueError('PresetTour input should have exactly one of '/
-				'numSteps or rotSpeed be nonzero.')
-		elif not constTime and not constSpeed:
-			raise ValueError('PresetTour input should have exactly one of '/
-				'numSteps or rotSpeed be nonzero.')
+		if constTime + constSpeed + constScreen != 1:
+			raise ValueError('PresetTour input should have exactly one of '\
+				'numSteps, rotSpeed or screenStep be nonzero.')
 
 		elif constTime:
 			self.mode = "constTime"
 			self.moveSteps = numSteps
 			self.rotSpeed = None 
+			self.screenStep = None
 
-		else:
+		elif constSpeed:
 			self.mode = "constSpeed"
 			self.moveSteps = None
 			self.rotSpeed = rotSpeed
+			self.screenStep = None
+
+		else:
+			self.mode = "constScreen"
+			self.moveSteps = None
+			self.rotSpeed = None
+			self.screenStep = screenStep
 
 		self.X = X
+		self.mu, self.sigma = standardization(X, center, scale)
 		self.framesList = framesList
 		self.stepsBetweenFrames = numSteps
 		self.index = 1
@@ -68,7 +90,7 @@ class PresetTour(SimpleTour):
 			path = interpolateFrames(sourceFrame, targetFrame)
 			self.listOfPaths += [path]
 
-			XB = self.X @ path[0]
+			XB = self.projectPath(sourceFrame, targetFrame, path[0])
 			self.listOfXB += [XB]
 
 		# Setup pausing option if we want to wait on certain frames.
@@ -110,5 +132,8 @@ class PresetTour(SimpleTour):
 		self.B, self.thetas, self.Wa = self.listOfPaths[self.index]
 		self.XB = self.listOfXB[self.index]
 
-		self.moveSteps = self.stepsBetweenFrames
+		if self.mode == "constScreen":
+			self.moveSteps = screenSteps(self.XB, self.thetas, self.screenStep)
+		else:
+			self.moveSteps = self.stepsBetweenFrames
 		
\ No newline at end of file
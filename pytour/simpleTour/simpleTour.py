@@ -7,11 +7,27 @@ class SimpleTour:
 		specified in utils. 
 	"""
 
+	# Whether the projections of the paths of this tour are kept in the cache
+	# selected with setCache. Only worth it for tours that revisit the same
+	# paths, as fingerprinting the data reads all of it.
+	persistPaths = False
 
-	def __init__(self, pause=0):
+
+	def __init__(self, pause=0, center=False, scale=False):
 		""" Constructs a SimpleTour object given a generator function that
 			specifies the next frame to travel to and the number of steps to
 			take. Should not be called explicitly.
+
+			Inputs:
+				pause - A non-negative int representing how many timesteps to
+					pause for whenever a new frame is reached. Zero by default.
+				center - A boolean. If True, the data is centered implicitly
+					when projected, without making a centered copy of X.
+					False by default.
+				scale - A boolean. If True, the data is scaled to unit variance
+					implicitly when projected, without making a scaled copy of
+					X. The variances are computed in a single pass over chunks
+					of rows. False by default.
 		"""
 
 		if not hasattr(self, 'nextFrame'):
@@ -21,6 +37,10 @@ class SimpleTour:
 			raise RuntimeError('SimpleTour instance has no specified '\
 				'X property.')
 
+		# Column means and deviations used to standardize the data
+		# implicitly when projecting.
+		self.mu, self.sigma = standardization(self.X, center, scale)
+
 		# Setup pausing option if we want to wait on certain frames.
 		self.pauseSteps = pause
 		self.moveFlag = True
@@ -73,17 +93,131 @@ class SimpleTour:
 
 		# Determine the parameters of the walk we should take.
 		self.B, self.thetas, self.Wa = interpolateFrames(self.Fa, self.Fz)
-		self.XB = self.X @ self.B
+		self.XB = self.projectPath(self.Fa, self.Fz, self.B)
+
+		# In constant screen speed mode, take just enough steps so that no
+		# projected point moves further than screenStep in a single step.
+		if getattr(self, 'mode', None) == "constScreen":
+			self.moveSteps = screenSteps(self.XB, self.thetas, self.screenStep)
+
+	def projectPath(self, Fa, Fz, B):
+		""" Projects the data onto the basis B of the path from Fa to Fz,
+			consulting the cache selected with setCache if there is one and
+			persistPaths is True.
+
+			The basis B returned by interpolateFrames contains a random
+			rotation, so the cache instead holds the data projected onto the
+			orthogonal basis Q of [Fa, Fz] computed by qr, which only depends
+			on the two frames, and XB is recovered as XQ (Q^T B).
+
+			Inputs:
+				Fa - A 2D numpy array of size (p,d) representing the source
+					frame of the path
+				Fz - A 2D numpy array of size (p,d) representing the target
+					frame of the path
+				B - A 2D numpy array of size (p,2d) representing the basis of
+					the path from Fa to Fz returned by interpolateFrames
+
+			Outputs:
+				A 2D numpy array of size (n,2d) representing the data projected
+				onto B.
+		"""
+		cache = getCache()
+		if cache is None or not self.persistPaths:
+			return projectData(self.X, B, self.mu, self.sigma)
+
+		# Fingerprinting reads all of X, so it is only done once per tour.
+		if getattr(self, 'dataKey', None) is None:
+			self.dataKey = fingerprint(self.X, self.mu, self.sigma)
+
+		Q, _ = qr( np.concatenate( (Fa,Fz), axis=1 ) )
+		XQ = cache.get(self.dataKey + fingerprint(Q),
+			lambda: projectData(self.X, Q, self.mu, self.sigma))
+
+		return XQ @ (Q.T @ B)
 
-	def currentProjection(self):
+	def currentProjection(self, rows=None):
 		""" Outputs the current projection of the tour.
+
+			Inputs:
+				rows - An index array selecting the points to project, or None
+					to project all of them. None by default.
 		"""
 		if self.moveFlag:
 			tau = self.thetas * self.t / self.moveSteps
 		else:
 			tau = self.thetas
 
-		return self.XB @ constructR(tau) @ self.Wa
+		XB = self.XB if rows is None else self.XB[rows]
+		return rotateProject(XB, tau, self.Wa)
+
+	def regionMask(self, polygon=None, box=None, chunkSize=2**14,
+		packed=False):
+		""" Determines which points lie inside a region of the projection at
+			every step of the current path, from step 0 at the source frame to
+			step moveSteps at the target frame. The projections of all steps
+			are computed from XB in a single product per chunk of points,
+			without advancing the tour.
+
+			Inputs:
+				polygon - A 2D numpy array of size (m,2) representing the
+					vertices of a polygon in the projection, or None.
+				box - A tuple (xmin, xmax, ymin, ymax) representing a box in
+					the projection, or None. Exactly one of polygon and box
+					should be given.
+				chunkSize - A positive int representing the number of points
+					tested at a time. 2**14 by default.
+				packed - A boolean. If True, the mask is packed into bits along
+					the steps with np.packbits. False by default.
+
+			Outputs:
+				A boolean 2D numpy array of size (n, moveSteps+1) where entry
+				(i,t) is True if point i lies inside the region at step t, or
+				its packed uint8 counterpart if packed is True. Only the first
+				two coordinates of the projection are used.
+		"""
+
+		if (polygon is None) == (box is None):
+			raise ValueError('regionMask should be given exactly one of '\
+				'polygon or box.')
+
+		# Stack the projection matrices of every step side by side, so each
+		# chunk of XB is projected onto all steps in one product.
+		numSteps = self.moveSteps + 1
+		fractions = np.arange(numSteps) / max(self.moveSteps, 1)
+		RWa = pathProjections(self.thetas, self.Wa[:, :2], fractions)
+		RWa = RWa.transpose(1, 0, 2).reshape(self.XB.shape[1], 2*numSteps)
+
+		# Packed masks are packed one chunk at a time, so the unpacked mask
+		# of all the points is never held in memory.
+		n = self.XB.shape[0]
+		if packed:
+			mask = np.empty( (n, (numSteps + 7) // 8), dtype=np.uint8 )
+		else:
+			mask = np.empty( (n, numSteps), dtype=bool )
+
+		for start in range(0, n, chunkSize):
+			proj = (self.XB[start:start+chunkSize] @ RWa).reshape(-1,
+				numSteps, 2)
+			x, y = proj[:, :, 0], proj[:, :, 1]
+			if box is not None:
+				inside = inBox(x, y, box)
+			else:
+				inside = inPolygon(x, y, polygon)
+
+			if packed:
+				inside = np.packbits(inside, axis=1)
+			mask[start:start+chunkSize] = inside
+
+		return mask
+
+	def currentStep(self):
+		""" Outputs the step of the current path the tour is at, which indexes
+			the columns of regionMask. While paused, this is the last step.
+		"""
+		if self.moveFlag:
+			return self.t
+		return self.moveSteps
 
 	def currentFrame(self):
 		""" Outputs the current frame of the tour.
@@ -95,14 +229,10 @@ class SimpleTour:
 		return self.B @ constructR(tau) @ self.Wa
 
 
-	def advance(self):
-		""" Advances the tour one step towards the current target frame. If the
-			current projection has reached the target frame, a target frame and
-			path are created.
-
-			Outputs:
-				A 2D numpy array representing the current projection after a
-				single step.
+	def step(self):
+		""" Advances the state of the tour one step towards the current target
+			frame, without computing the projection. If the current projection
+			has reached the target frame, a target frame and path are created.
 		"""
 		
 		# If we're moving to the next frame, ...
@@ -135,10 +265,21 @@ class SimpleTour:
 				self.createPathToNewFrame()
 				self.moveFlag = True
 
+	def advance(self, numSteps=1):
+		""" Advances the tour numSteps steps towards the current target frame.
+			Only the projection after the last step is computed, so skipping
+			over intermediate steps is cheap.
 
-		return self.currentProjection()
-
-
+			Inputs:
+				numSteps - A non-negative int representing the number of steps
+					to take. One by default.
 
+			Outputs:
+				A 2D numpy array representing the current projection after
+				numSteps steps.
+		"""
 
+		for _ in range(numSteps):
+			self.step()
 
+		return self.currentProjection()
@@ -1,2 +1,7 @@
 from .utils import *
-
+from .projection import *
+from .shardedData import *
+from .regions import *
+from .kernels import *
+from .cache import *
+from .sampling import *
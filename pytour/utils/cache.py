@@ -0,0 +1,199 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from .projection import isSparse
+
+def fingerprint(*arrays, chunkSize=2**24):
+    """ Calculate a fingerprint of the contents of some arrays, used to
+        address cached data by content.
+
+        Inputs:
+            *arrays - numpy arrays, numpy memmaps, scipy.sparse matrices,
+                objects convertible to numpy arrays, or None
+            chunkSize - A positive int representing the number of bytes hashed
+                at a time, so memory-mapped arrays are never loaded in full.
+                2**24 by default.
+
+        Outputs:
+            A string of 32 hexadecimal digits identifying the arrays.
+    """
+    h = hashlib.blake2b(digest_size=16)
+
+    for A in arrays:
+        if A is None:
+            h.update(b"none")
+            continue
+
+        if isSparse(A):
+            A = A.tocsr()
+            h.update(b"csr%r" % (A.shape,))
+            parts = (A.data, A.indices, A.indptr)
+        else:
+            A = np.asarray(A)
+            parts = (A,)
+
+        for part in parts:
+            part = np.ascontiguousarray(part)
+            h.update(b"%r%s" % (part.shape, part.dtype.str.encode()))
+            buffer = part.reshape(-1).view(np.uint8)
+            for start in range(0, buffer.size, chunkSize):
+                h.update(buffer[start:start+chunkSize])
+
+    return h.hexdigest()
+
+class XBCache:
+    """ A content-addressed cache of projected data. Entries are kept in
+        memory up to a size limit, evicting the least recently used first,
+        and optionally saved to a directory as .npy files that are memory
+        mapped when loaded, evicting the least recently used files once the
+        directory exceeds its own size limit.
+
+        Use setCache to make tours consult a cache.
+    """
+
+    def __init__(self, maxBytes=2**30, directory=None, maxDiskBytes=2**34):
+        """ Constructs an XBCache object.
+
+            Inputs:
+                maxBytes - A non-negative int representing the largest total
+                    size in bytes of the entries held in memory. 2**30 by
+                    default.
+                directory - A string representing the directory entries are
+                    saved to, or None to only cache in memory. None by
+                    default.
+                maxDiskBytes - A non-negative int representing the largest
+                    total size in bytes of the files in the directory. 2**34
+                    by default.
+
+            Outputs:
+                An XBCache object
+        """
+        self.maxBytes = maxBytes
+        self.directory = directory
+        self.maxDiskBytes = maxDiskBytes
+
+        self.entries = OrderedDict()
+        self.numBytes = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, key, compute):
+        """ Return the array stored under key, computing and storing it if it
+            is not cached yet.
+
+            Inputs:
+                key - A string identifying the array, see fingerprint
+                compute - A function of no arguments returning the array
+
+            Outputs:
+                The cached array. It may be a read-only memory-mapped array,
+                and should not be modified.
+        """
+
+        # Look in memory first, ...
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        # ... then on disk, ...
+        path = self.path(key)
+        if path is not None and os.path.exists(path):
+            array = np.load(path, mmap_mode="r")
+
+            # Mark the file as recently used, unless the directory is shared
+            # read-only.
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+        # ... and otherwise compute it.
+        else:
+            array = np.asarray(compute())
+            if path is not None:
+                self.save(path, array)
+
+        self.remember(key, array)
+        return array
+
+    def path(self, key):
+        """ Return the file an entry is saved to, or None if the cache is in
+            memory only.
+        """
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, key + ".npy")
+
+    def remember(self, key, array):
+        """ Hold an entry in memory, evicting the least recently used ones
+            beyond maxBytes.
+        """
+        if array.nbytes > self.maxBytes:
+            return
+
+        self.entries[key] = array
+        self.numBytes += array.nbytes
+
+        while self.numBytes > self.maxBytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.numBytes -= evicted.nbytes
+
+    def save(self, path, array):
+        """ Save an entry to disk, evicting the least recently used files
+            beyond maxDiskBytes.
+        """
+        if array.nbytes > self.maxDiskBytes:
+            return
+
+        # Write to a temporary file first, so concurrent sessions never load
+        # a partially written entry.
+        temporary = "%s.%d.tmp" % (path, os.getpid())
+        with open(temporary, "wb") as f:
+            np.save(f, array)
+        os.replace(temporary, path)
+
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".npy"):
+                stat = os.stat(os.path.join(self.directory, name))
+                files += [(stat.st_mtime, stat.st_size, name)]
+
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.maxDiskBytes:
+                break
+            if os.path.join(self.directory, name) == path:
+                continue
+            os.remove(os.path.join(self.directory, name))
+            total -= size
+
+    def clear(self):
+        """ Remove every entry held in memory. Files on disk are kept.
+        """
+        self.entries.clear()
+        self.numBytes = 0
+
+# The cache consulted by tours, see setCache.
+_cache = None
+
+def setCache(cache):
+    """ Select the cache tours consult when projecting the data onto a new
+        path.
+
+        Inputs:
+            cache - An XBCache object, or None to disable caching.
+
+        Outputs:
+            No output given, but the cache is changed.
+    """
+    global _cache
+    _cache = cache
+
+def getCache():
+    """ Return the cache tours consult, or None if caching is disabled.
+    """
+    return _cache
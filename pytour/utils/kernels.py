@@ -0,0 +1,104 @@
+import numpy as np
+
+from .utils import constructR
+
+# Numba is only imported once its backend is requested, as importing it is
+# slow and most sessions never use it, see loadNumba.
+numba = None
+
+# The backend used by rotateProject, see setBackend. The numba backend is
+# opt-in, as it pays a compilation cost and only wins with several cores.
+_backend = "numpy"
+
+def setBackend(backend="auto"):
+    """ Select the backend used to compute the projections of tours.
+
+        Inputs:
+            backend - A string. "numpy" multiplies by the combined rotation in
+                numpy, "numba" uses a multithreaded compiled kernel and "auto"
+                uses numba whenever it is installed. "auto" by default.
+
+        Outputs:
+            No output given, but the backend is changed. An ImportError is
+            raised if "numba" is requested but numba is not installed.
+    """
+    global _backend
+
+    if backend == "auto":
+        backend = "numba" if loadNumba() else "numpy"
+
+    if backend not in ("numpy", "numba"):
+        raise ValueError('Unknown backend "%s", expected "auto", "numpy" or '\
+            '"numba".' % backend)
+    if backend == "numba" and not loadNumba():
+        raise ImportError('The numba backend requires numba to be installed.')
+
+    _backend = backend
+
+def getBackend():
+    """ Return the name of the backend used to compute projections, either
+        "numpy" or "numba".
+    """
+    return _backend
+
+def loadNumba():
+    """ Import numba and compile the kernel of the numba backend, unless it
+        was already done.
+
+        Outputs:
+            True if numba is installed, and False otherwise.
+    """
+    global numba, _fusedProject
+
+    if numba is None:
+        try:
+            import numba
+        except ImportError:
+            return False
+        _fusedProject = numba.njit(parallel=True, cache=True)(_fusedProject)
+
+    return True
+
+def _fusedProject(XB, RWa, out):
+    """ Compute out = XB RWa one row at a time across threads, without any
+        intermediate array. Compiled by loadNumba.
+    """
+    n, m = XB.shape
+    k = RWa.shape[1]
+    for i in numba.prange(n):
+        for c in range(k):
+            total = 0.0
+            for j in range(m):
+                total += XB[i, j] * RWa[j, c]
+            out[i, c] = total
+
+def rotateProject(XB, thetas, Wa, out=None):
+    """ Calculate the projection XB constructR(thetas) Wa of the data along a
+        path. The Givens rotations are folded into Wa first, so the data is
+        only traversed once and the (n,2d) rotated data is never formed.
+
+        Inputs:
+            XB - A 2D numpy array of size (n,2d) representing the data
+                projected onto the basis B of the path
+            thetas - A 1D numpy array representing angles in radians of size
+                (d)
+            Wa - A 2D numpy array representing an orthogonal matrix of size
+                (2d, k)
+            out - A 2D numpy array of size (n,k) to write the projection into,
+                or None to allocate a new one. None by default.
+
+        Outputs:
+            A 2D numpy array of size (n,k) representing the projection.
+    """
+    RWa = constructR(thetas) @ Wa
+
+    if out is None:
+        out = np.empty( (XB.shape[0], RWa.shape[1]),
+            dtype=np.result_type(XB, RWa) )
+
+    if _backend == "numba":
+        _fusedProject(np.ascontiguousarray(XB), RWa, out)
+    else:
+        np.matmul(XB, RWa, out=out)
+
+    return out
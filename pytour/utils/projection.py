@@ -0,0 +1,144 @@
+import numpy as np
+
+try:
+    import scipy.sparse as sparse
+except ImportError:
+    sparse = None
+
+def isSparse(X):
+    """ Check whether the data matrix is a scipy.sparse matrix or array.
+
+        Inputs:
+            X - A 2D numpy array or scipy.sparse matrix
+
+        Outputs:
+            True if X is a scipy.sparse matrix or array, and False otherwise.
+            Always False if scipy is not installed.
+    """
+    return sparse is not None and sparse.issparse(X)
+
+def columnMeans(X):
+    """ Calculate the mean of each column of the data without densifying it.
+
+        Inputs:
+            X - A 2D numpy array or scipy.sparse matrix of shape (n,p)
+
+        Outputs:
+            A 1D numpy array of size (p) holding the column means of X.
+    """
+    return np.asarray( X.mean(axis=0) ).ravel()
+
+def columnMoments(X, chunkSize=2**16):
+    """ Calculate the mean and variance of each column of the data in a single
+        streaming pass over chunks of rows. The moments of each chunk are
+        merged into the running moments with the parallel update of Chan et
+        al., so only one chunk is ever held in memory. This makes it suitable
+        for memory-mapped and sparse data.
+
+        Inputs:
+            X - A 2D numpy array, numpy memmap or scipy.sparse matrix of shape
+                (n,p). Any object supporting row slicing may be used.
+            chunkSize - A positive int representing the number of rows read at
+                a time. 2**16 by default.
+
+        Outputs:
+            mu - A 1D numpy array of size (p) holding the column means of X
+            var - A 1D numpy array of size (p) holding the population column
+                variances of X
+    """
+    # Other sparse formats cannot be sliced by row, or not efficiently.
+    if isSparse(X) and X.format != "csr":
+        X = X.tocsr()
+
+    n, p = X.shape
+    count = 0
+    mu = np.zeros(p)
+    M2 = np.zeros(p)
+
+    for start in range(0, n, chunkSize):
+        chunk = X[start:start+chunkSize]
+        m = chunk.shape[0]
+
+        # Moments of the chunk. Sparse chunks use the sum of squares rather
+        # than the squared deviations, which would densify them.
+        if isSparse(chunk):
+            chunkMu = np.asarray( chunk.mean(axis=0) ).ravel()
+            chunkM2 = np.asarray( chunk.multiply(chunk).sum(axis=0) ).ravel()
+            chunkM2 = np.maximum( chunkM2 - m * chunkMu**2, 0 )
+        else:
+            chunk = np.asarray(chunk, dtype=float)
+            chunkMu = chunk.mean(axis=0)
+            chunkM2 = ((chunk - chunkMu)**2).sum(axis=0)
+
+        # Merge them into the running moments.
+        delta = chunkMu - mu
+        total = count + m
+        mu += delta * m / total
+        M2 += chunkM2 + delta**2 * count * m / total
+        count = total
+
+    return mu, M2 / max(count, 1)
+
+def standardization(X, center=False, scale=False, chunkSize=2**16):
+    """ Calculate the parameters used by projectData to center and scale the
+        data implicitly.
+
+        Inputs:
+            X - A 2D numpy array, numpy memmap or scipy.sparse matrix of shape
+                (n,p)
+            center - A boolean. If True, the column means are returned.
+            scale - A boolean. If True, the column standard deviations are
+                returned. Columns of zero variance are left unscaled.
+            chunkSize - A positive int representing the number of rows read at
+                a time. 2**16 by default.
+
+        Outputs:
+            mu - A 1D numpy array of size (p) holding the column means of X, or
+                None if center is False
+            sigma - A 1D numpy array of size (p) holding the column standard
+                deviations of X, or None if scale is False
+    """
+    mu, sigma = None, None
+
+    if scale:
+        mu, var = columnMoments(X, chunkSize)
+        sigma = np.sqrt(var)
+        sigma[sigma == 0] = 1
+    elif center:
+        mu = columnMeans(X)
+
+    if not center:
+        mu = None
+
+    return mu, sigma
+
+def projectData(X, B, mu=None, sigma=None):
+    """ Project the data onto the basis B, optionally centering and scaling
+        the data beforehand.
+
+        When X is sparse, the product is computed as a sparse-dense product so
+        that only the (n,2d) output is ever dense. Centering and scaling are
+        folded into the basis and the projected output instead of the data,
+        using the identity (X - mu) / sigma B = X (B / sigma) - mu (B / sigma),
+        so a standardized copy of X is never made.
+
+        Inputs:
+            X - A 2D numpy array or scipy.sparse matrix of shape (n,p)
+            B - A 2D numpy array of shape (p,k)
+            mu - A 1D numpy array of size (p) to subtract from every row of X,
+                or None if the data should not be centered. None by default.
+            sigma - A 1D numpy array of size (p) to divide every row of X by,
+                or None if the data should not be scaled. None by default.
+
+        Outputs:
+            A 2D numpy array of shape (n,k) representing (X - mu) / sigma B.
+    """
+    if sigma is not None:
+        B = B / sigma[:, None]
+
+    XB = np.asarray( X @ B )
+
+    if mu is not None:
+        XB = XB - mu @ B
+
+    return XB
@@ -0,0 +1,74 @@
+import numpy as np
+
+def inBox(x, y, box):
+    """ Test which points lie inside an axis-aligned box.
+
+        Inputs:
+            x - A numpy array of horizontal coordinates
+            y - A numpy array of vertical coordinates, of the same shape as x
+            box - A tuple (xmin, xmax, ymin, ymax) representing the box
+
+        Outputs:
+            A boolean numpy array of the same shape as x, True for the points
+            inside the box (boundary included).
+    """
+    xmin, xmax, ymin, ymax = box
+    return (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+
+def inPolygon(x, y, vertices):
+    """ Test which points lie inside a polygon using the even-odd rule. All
+        points are tested against one edge at a time, so the cost is a few
+        array operations per edge.
+
+        Inputs:
+            x - A numpy array of horizontal coordinates
+            y - A numpy array of vertical coordinates, of the same shape as x
+            vertices - A 2D numpy array of size (m,2) representing the
+                vertices of the polygon in order. The polygon is closed
+                implicitly.
+
+        Outputs:
+            A boolean numpy array of the same shape as x, True for the points
+            inside the polygon.
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    inside = np.zeros(np.shape(x), dtype=bool)
+
+    for k in range(len(vertices)):
+        x1, y1 = vertices[k]
+        x2, y2 = vertices[k-1]
+
+        # Flip the points whose horizontal ray to the left crosses the edge.
+        crosses = (y1 > y) != (y2 > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xCross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+        inside ^= crosses & (x < xCross)
+
+    return inside
+
+def regionTransitions(mask):
+    """ List every time a point enters or leaves a region, given its
+        membership at every step.
+
+        Inputs:
+            mask - A boolean 2D numpy array of size (n,T) where mask[i,t] is
+                True if point i is inside the region at step t
+
+        Outputs:
+            points - A 1D numpy array of the indices of the points that change
+                membership, sorted by point then step
+            steps - A 1D numpy array of the same size holding the step at
+                which each change happens. Points inside the region at the
+                first step enter it at step 0.
+            entering - A boolean 1D numpy array of the same size, True when
+                the point enters the region and False when it leaves it.
+    """
+    mask = np.asarray(mask, dtype=np.int8)
+    padded = np.concatenate( (np.zeros((mask.shape[0], 1), np.int8), mask),
+        axis=1 )
+    changes = np.diff(padded, axis=1)
+
+    points, steps = np.nonzero(changes)
+    entering = changes[points, steps] > 0
+
+    return points, steps, entering
@@ -0,0 +1,56 @@
+import numpy as np
+
+def stratifiedOrder(P, cells=1024, seed=None):
+    """ Order points so that every prefix of the order is a stratified
+        subsample of them. The bounding box of the points is divided into a
+        grid, and the order takes one point from every occupied cell in turn,
+        so sparse regions and outliers appear early while dense regions are
+        thinned out.
+
+        Passing the data projected onto the basis B of a path, XB, stratifies
+        the points for every projection along the path at once, since each
+        of them is a linear map of XB.
+
+        Inputs:
+            P - A 2D numpy array of size (n,k) giving the position of every
+                point
+            cells - A positive int representing the approximate number of
+                cells of the grid, which has the same number of cells, at
+                least two, along each of the k axes. 1024 by default.
+            seed - An int or numpy Generator used to shuffle points within each
+                cell, or None. None by default.
+
+        Outputs:
+            A 1D numpy array of size (n) representing a permutation of the
+            points.
+    """
+    rng = np.random.default_rng(seed)
+    n, k = P.shape
+    bins = max(2, int(round( cells ** (1.0 / max(k, 1)) )))
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # Assign every point to a cell of the grid.
+    index = np.zeros( (n, k), dtype=np.int64 )
+    for axis in range(k):
+        x = P[:, axis]
+        low, high = x.min(), x.max()
+        width = (high - low) / bins if high > low else 1.0
+        index[:, axis] = np.minimum( ((x - low) / width).astype(np.int64),
+            bins-1 )
+
+    # A single integer per cell, so grouping by cell is a 1D sort.
+    cellOf = np.ravel_multi_index(index.T, (bins,)*k)
+
+    # Rank the points within their cell in a random order, and order all
+    # points by rank, so the first pass visits every cell once.
+    perm = rng.permutation(n)
+    byCell = np.argsort(cellOf[perm], kind="stable")
+    sortedCells = cellOf[perm][byCell]
+    groupStart = np.concatenate( ([True], sortedCells[1:] != sortedCells[:-1]) )
+    starts = np.maximum.accumulate( np.where(groupStart, np.arange(n), 0) )
+
+    ranks = np.empty(n, dtype=np.int64)
+    ranks[byCell] = np.arange(n) - starts
+
+    return perm[ np.argsort(ranks, kind="stable") ]
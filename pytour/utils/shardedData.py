@@ -0,0 +1,160 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Shared memory blocks attached by a worker process, keyed by name.
+_attached = {}
+
+def _attach(name, shape, dtype):
+    """ Attach to a shared memory block from within a worker process.
+
+        Inputs:
+            name - A string representing the name of the shared memory block
+            shape - A tuple representing the shape of the array it holds
+            dtype - The numpy dtype of the array it holds
+
+        Outputs:
+            A numpy array backed by the shared memory block.
+    """
+    if name not in _attached:
+        # The block is owned, and unlinked, by the parent process, whose
+        # resource tracker the workers share.
+        _attached[name] = shared_memory.SharedMemory(name=name)
+    return np.ndarray(shape, dtype=dtype, buffer=_attached[name].buf)
+
+def _multiplyShard(inputSpec, outputSpec, start, stop, B):
+    """ Multiply the rows start to stop of the shared data by B, writing the
+        result into the same rows of the shared output.
+    """
+    X = _attach(*inputSpec)
+    out = _attach(*outputSpec)
+    np.matmul(X[start:stop], B, out=out[start:stop])
+
+class ShardedData:
+    """ A wrapper around a tall 2D array that computes products X @ B by
+        sharding the rows of X across a pool of worker processes. The data is
+        copied once into shared memory, so every worker reads its shard of X
+        and writes its shard of X @ B in place, and only B is sent to the
+        workers.
+
+        A ShardedData object can be passed as X to any tour.
+    """
+
+    def __init__(self, X, numWorkers=None, chunkSize=2**20):
+        """ Constructs a ShardedData object.
+
+            Inputs:
+                X - A 2D numpy array of shape (n,p), possibly memory-mapped,
+                    representing the data to be visualized
+                numWorkers - A positive int representing the number of worker
+                    processes, or None to use one per CPU. None by default.
+                chunkSize - A positive int representing the number of rows
+                    copied into shared memory at a time. 2**20 by default.
+
+            Outputs:
+                A ShardedData object
+        """
+
+        if numWorkers is None:
+            numWorkers = multiprocessing.cpu_count()
+
+        self.shape = X.shape
+        self.dtype = np.dtype(X.dtype)
+        self.numWorkers = numWorkers
+
+        # Copy the data into shared memory in chunks, so memory-mapped inputs
+        # are never loaded in full.
+        self.inputShm = shared_memory.SharedMemory(create=True,
+            size=max(1, int(np.prod(self.shape)) * self.dtype.itemsize))
+        self.data = np.ndarray(self.shape, dtype=self.dtype,
+            buffer=self.inputShm.buf)
+        for start in range(0, self.shape[0], chunkSize):
+            self.data[start:start+chunkSize] = X[start:start+chunkSize]
+
+        self.outputShm = None
+        self.outputShape = None
+        self.outputDtype = None
+
+        # Split the rows into one contiguous shard per worker.
+        bounds = np.linspace(0, self.shape[0], numWorkers+1).astype(int)
+        self.shards = list(zip(bounds[:-1], bounds[1:]))
+
+        self.pool = multiprocessing.Pool(numWorkers)
+
+    def __matmul__(self, B):
+        """ Computes X @ B across the worker processes.
+
+            Inputs:
+                B - A 2D numpy array of shape (p,k)
+
+            Outputs:
+                A 2D numpy array of shape (n,k) representing X @ B.
+        """
+
+        B = np.asarray(B)
+        outputShape = (self.shape[0], B.shape[1])
+        dtype = np.result_type(self.dtype, B.dtype)
+
+        # Reuse the shared output buffer whenever the shape allows it.
+        if self.outputShape != outputShape or self.outputDtype != dtype:
+            self.releaseOutput()
+            self.outputShm = shared_memory.SharedMemory(create=True,
+                size=max(1, int(np.prod(outputShape)) * dtype.itemsize))
+            self.outputShape = outputShape
+            self.outputDtype = dtype
+
+        inputSpec = (self.inputShm.name, self.shape, self.dtype)
+        outputSpec = (self.outputShm.name, self.outputShape, self.outputDtype)
+        self.pool.starmap(_multiplyShard, [
+            (inputSpec, outputSpec, start, stop, B)
+            for start, stop in self.shards if stop > start
+        ])
+
+        out = np.ndarray(outputShape, dtype=dtype, buffer=self.outputShm.buf)
+        return out.copy()
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.data, dtype=dtype)
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def mean(self, axis=None):
+        """ Computes the mean of the data along the given axis.
+        """
+        return self.data.mean(axis=axis)
+
+    def releaseOutput(self):
+        """ Frees the shared output buffer, if any.
+        """
+        if self.outputShm is not None:
+            self.outputShm.close()
+            self.outputShm.unlink()
+            self.outputShm = None
+        self.outputShape = None
+        self.outputDtype = None
+
+    def close(self):
+        """ Stops the worker processes and frees all shared memory. The object
+            cannot be used afterwards.
+        """
+        if getattr(self, 'pool', None) is None:
+            return
+        self.pool.terminate()
+        self.pool.join()
+        self.pool = None
+
+        self.releaseOutput()
+        del self.data
+        self.inputShm.close()
+        self.inputShm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        self.close()
@@ -157,6 +157,39 @@ def constructR(thetas, odd=False):
     return R
 
 
+def pathProjections(thetas, Wa, fractions):
+    """ Given the path specified by F(t) = B constructR(thetas*t) Wa, calculate
+        the matrices constructR(thetas*t) Wa for many times t at once, so that
+        the projections XB constructR(thetas*t) Wa can be computed in a single
+        product.
+
+        Inputs:
+            thetas - A 1D numpy array representing angles in radians of size 
+                (d)
+            Wa - A 2D numpy array representing an orthogonal matrix of size
+                (2d, k)
+            fractions - A 1D numpy array of size (T) representing the times t
+                along the path
+
+        Outputs:
+            A 3D numpy array of size (T,2d,k) whose t-th entry is
+            constructR(thetas*fractions[t]) Wa.
+    """
+
+    angles = np.outer(fractions, thetas)
+    cos = np.cos(angles)[:, :, None]
+    sin = np.sin(angles)[:, :, None]
+
+    # Rows 2j and 2j+1 of R Wa only mix rows 2j and 2j+1 of Wa.
+    even = Wa[0::2][None]
+    odd  = Wa[1::2][None]
+
+    RWa = np.empty( (len(fractions),) + Wa.shape )
+    RWa[:, 0::2] =  cos * even + sin * odd
+    RWa[:, 1::2] = -sin * even + cos * odd
+
+    return RWa
+
 def pathSpeed(B, thetas, Wa, alpha_p=2, alpha_w=1 ):
     """ Given the path specified by F(t) = B constructR(thetas*t) Wa, calculate 
         the speed of the path of frames as given by the formula:
@@ -188,3 +221,52 @@ def pathSpeed(B, thetas, Wa, alpha_p=2, alpha_w=1 ):
     speed += (alpha_w-alpha_p) * np.linalg.norm(Wa.T @ D @ Wa, "fro")**2
 
     return speed
+
+def maxDisplacement(XB, thetas):
+    """ Given the projected data XB and the angles of the path specified by
+        F(t) = B constructR(thetas*t) Wa, calculate an upper bound on how far
+        any projected point travels as t goes from 0 to 1.
+
+        Every row of XB is rotated by an angle thetas[j] within the plane of
+        columns 2j and 2j+1, so the i-th point moves along the path at the
+        constant speed sqrt( sum_j thetas[j]^2 * |XB[i, 2j:2j+2]|^2 ) before
+        being projected by Wa, which cannot increase distances.
+
+        Inputs:
+            XB - A 2D numpy array of size (n,2d) representing the data
+                projected onto the basis B of the path
+            thetas - A 1D numpy array representing angles in radians of size 
+                (d)
+
+        Outputs:
+            A non-negative float bounding the distance travelled by any single
+            projected point along the whole path.
+    """
+
+    n = XB.shape[0]
+    if n == 0:
+        return 0.0
+
+    # Squared radius of every point within each plane of rotation.
+    radii = XB[:, 0::2]**2 + XB[:, 1::2]**2
+
+    return float( np.sqrt( np.max(radii @ np.asarray(thetas)**2) ) )
+
+def screenSteps(XB, thetas, screenStep):
+    """ Calculate the number of steps needed so that no projected point moves
+        further than screenStep in a single step along the path specified by
+        F(t) = B constructR(thetas*t) Wa.
+
+        Inputs:
+            XB - A 2D numpy array of size (n,2d) representing the data
+                projected onto the basis B of the path
+            thetas - A 1D numpy array representing angles in radians of size 
+                (d)
+            screenStep - A positive float representing the largest distance
+                any projected point may move in a single step
+
+        Outputs:
+            A positive int representing the number of steps to take.
+    """
+
+    return max(1, int(np.ceil( maxDisplacement(XB, thetas) / screenStep )))